@@ -0,0 +1,91 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+
+
+class LLMScoreCache:
+    """In-memory LRU cache for model quality scores keyed by (model_id, prompt).
+
+    Each entry stores the scores for one scoring request as a mapping of
+    document ID to score, so multi-document prompts cache all their scores
+    under a single key.
+
+    Scoring prompts are deterministic (temperature is effectively 0 for the
+    quality task), so identical (model, prompt) pairs always produce the same
+    score and can be served from the cache instead of paying a full LLM
+    round-trip on re-runs or near-duplicate corpora.
+
+    Attributes:
+        ttl_seconds: Maximum age of a cached score before it is evicted.
+        max_entries: Maximum number of entries held before LRU eviction.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 24 * 60 * 60,
+        max_entries: int = 8192,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Time-to-live for cached scores. Defaults to 24 hours.
+            max_entries: Upper bound on cached entries. Defaults to 8192.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[dict[str, float], float]] = OrderedDict()
+
+    @staticmethod
+    def build_key(model_id: str, prompt: str) -> str:
+        """Build a stable cache key from the model identifier and prompt.
+
+        Args:
+            model_id: Identifier of the language model.
+            prompt: Full prompt text sent to the model.
+
+        Returns:
+            str: SHA-256 hex digest uniquely identifying the request.
+        """
+        payload = json.dumps({"model": model_id, "prompt": prompt}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict[str, float] | None:
+        """Look up cached scores.
+
+        Args:
+            key: Cache key built with `build_key`.
+
+        Returns:
+            dict[str, float] | None: The cached scores by document ID, or
+                None on miss/expiry.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        scores, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        # Refresh recency for LRU eviction
+        self._entries.move_to_end(key)
+        return scores
+
+    def set(self, key: str, scores: dict[str, float]) -> None:
+        """Store scores in the cache, evicting the oldest entry when full.
+
+        Args:
+            key: Cache key built with `build_key`.
+            scores: Quality scores by document ID to cache.
+        """
+        self._entries[key] = (scores, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# Process-global cache shared by default across agent instances so batch runs
+# within the same pipeline process benefit from each other's results.
+default_llm_score_cache = LLMScoreCache()
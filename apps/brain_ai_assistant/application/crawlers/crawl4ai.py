@@ -1,6 +1,7 @@
 import asyncio
-import os
-import psutil
+import secrets
+from urllib.parse import urlparse
+
 from loguru import logger
 from crawl4ai import AsyncWebCrawler, CacheMode
 
@@ -18,17 +19,61 @@ class Crawl4AICrawler:
     """
 
     def __init__(
-            self, 
-            max_concurrent_tasks : int = 10
+            self,
+            max_concurrent_tasks : int = 10,
+            requests_per_second_per_host : float = 2.0,
+            cache_mode : CacheMode = CacheMode.ENABLED
             ) -> None:
         """
         Set up crawler with specified concurrency settings
 
         Args :
             max_concurrent_tasks : Limit on parallel HTTP requests. Defaults to 10.
+            requests_per_second_per_host : Politeness budget applied per target
+                host. Requests to different hosts never throttle each other.
+            cache_mode : Crawl4AI cache policy. Defaults to ENABLED so URLs
+                seen before are served from the local cache; pass
+                CacheMode.BYPASS to force fresh fetches.
         """
         self.max_concurrent_tasks = max_concurrent_tasks
-    
+        self.requests_per_second_per_host = requests_per_second_per_host
+        self.cache_mode = cache_mode
+        self._host_rate_limiters : dict[str, utils.AsyncTokenBucket] = {}
+        self._crawler : AsyncWebCrawler | None = None
+
+    async def __aenter__(self) -> "Crawl4AICrawler":
+        """
+        Start a long-lived crawler reused by every subsequent batch.
+
+        Entering the context once amortises browser/HTTP-client setup across
+        all batches and keeps its connection pool warm between them.
+
+        Returns:
+            Crawl4AICrawler : Current instance with a pooled crawler attached
+        """
+        self._crawler = AsyncWebCrawler(cache_mode=self.cache_mode)
+        await self._crawler.__aenter__()
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, exception_traceback) -> None:
+        """
+        Shut down the pooled crawler when leaving the context.
+
+        Args:
+            exception_type: Exception type if raised
+            exception_value: Exception value if raised
+            exception_traceback: Exception traceback if raised
+        """
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Explicitly release the pooled crawler and its browser resources.
+        """
+        if self._crawler is not None:
+            await self._crawler.__aexit__(None, None, None)
+            self._crawler = None
+
     def __call__(
             self, 
             documents : list[Document]
@@ -64,42 +109,57 @@ class Crawl4AICrawler:
         Returns:
             list[Document]: Collection of new documents created from successful crawl operations.
         """
-        # Track resource usage for performance monitoring
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss
-        logger.debug(
-            f"Beginning batch crawl with {self.max_concurrent_tasks} concurrent requests. "
-            f"Initial memory consumption: {initial_memory // (1024 * 1024)} MB"
-        )
+        # Track resource usage when profiling is enabled via BRAIN_PROFILE_MEM
+        initial_memory = utils.memory_usage_bytes()
+        if initial_memory is not None:
+            logger.debug(
+                f"Beginning batch crawl with {self.max_concurrent_tasks} concurrent requests. "
+                f"Initial memory consumption: {initial_memory // (1024 * 1024)} MB"
+            )
 
         # Implement concurrency control
         semaphore = asyncio.Semaphore(self.max_concurrent_tasks)
-        crawled_results = []
-
-        # Initialize crawler with fresh content setting
-        async with AsyncWebCrawler(cache_mode=CacheMode.BYPASS) as crawler:
-            # Process each source document
-            for document in documents:
-                # Create parallel tasks for all URLs in document
-                crawl_tasks = [
-                    self.__crawl_url(crawler, document, url, semaphore)
-                    for url in document.child_urls
-                ]
-                # Execute tasks concurrently
-                batch_results = await asyncio.gather(*crawl_tasks)
-                crawled_results.extend(batch_results)
-
-        # Evaluate resource impact post-crawling
-        final_memory = process.memory_info().rss
-        memory_difference = final_memory - initial_memory
-        logger.debug(
-            f"Batch crawl completed. "
-            f"Final memory consumption: {final_memory // (1024 * 1024)} MB, "
-            f"Incremental memory usage: {memory_difference // (1024 * 1024)} MB"
-        )
+
+        # Deduplicate URLs shared by multiple parent documents so each URL is
+        # crawled exactly once; the first parent seen keeps the attribution
+        unique_urls : dict[str, Document] = {}
+        for document in documents:
+            for url in document.child_urls:
+                unique_urls.setdefault(url, document)
+
+        if self._crawler is not None:
+            # Reuse the pooled crawler started by __aenter__
+            crawled_results = await self.__crawl_unique_urls(
+                self._crawler, unique_urls, semaphore
+            )
+        else:
+            # No pooled instance; spin up a crawler for this batch only
+            async with AsyncWebCrawler(cache_mode=self.cache_mode) as crawler:
+                crawled_results = await self.__crawl_unique_urls(
+                    crawler, unique_urls, semaphore
+                )
+
+        # Log tasks that raised instead of returning a result
+        for result in crawled_results:
+            if isinstance(result, BaseException):
+                logger.warning(f"Crawl task failed: {result}")
+
+        # Evaluate resource impact post-crawling when profiling is enabled
+        final_memory = utils.memory_usage_bytes()
+        if initial_memory is not None and final_memory is not None:
+            memory_difference = final_memory - initial_memory
+            logger.debug(
+                f"Batch crawl completed. "
+                f"Final memory consumption: {final_memory // (1024 * 1024)} MB, "
+                f"Incremental memory usage: {memory_difference // (1024 * 1024)} MB"
+            )
 
         # Retain only successful crawl results
-        successful_documents = [result for result in crawled_results if result is not None]
+        successful_documents = [
+            result
+            for result in crawled_results
+            if result is not None and not isinstance(result, BaseException)
+        ]
 
         # Report crawling effectiveness metrics
         success_count = len(successful_documents)
@@ -112,7 +172,35 @@ class Crawl4AICrawler:
         )
 
         return successful_documents
-    
+
+    async def __crawl_unique_urls(
+            self,
+            crawler: AsyncWebCrawler,
+            unique_urls: dict[str, Document],
+            semaphore: asyncio.Semaphore
+            ) -> list[Document | None | BaseException]:
+        """
+        Crawl a set of deduplicated URLs concurrently with a shared crawler.
+
+        Args:
+            crawler: Web crawler instance handling HTTP operations
+            unique_urls: Mapping of URL to the parent document it came from
+            semaphore: Concurrency control mechanism
+
+        Returns:
+            list[Document | None | BaseException]: One entry per URL with the
+                crawled document, None on failure, or the raised exception.
+        """
+        # Build one flat task set across all unique URLs so a slow URL in
+        # one document doesn't hold back the others
+        crawl_tasks = [
+            self.__crawl_url(crawler, parent_document, url, semaphore)
+            for url, parent_document in unique_urls.items()
+        ]
+
+        # Execute all tasks concurrently
+        return await asyncio.gather(*crawl_tasks, return_exceptions=True)
+
     async def __crawl_url(
         self,
         crawler: AsyncWebCrawler,
@@ -134,10 +222,20 @@ class Crawl4AICrawler:
         """
 
         async with request_limiter:
+            # Throttle per target host so requests to distinct hosts don't
+            # serialize behind each other; setdefault is safe here because
+            # the event loop doesn't switch tasks between lookup and insert
+            host = urlparse(url).netloc
+            host_limiter = self._host_rate_limiters.setdefault(
+                host,
+                utils.AsyncTokenBucket(
+                    max_rate=self.requests_per_second_per_host, time_period=1.0
+                ),
+            )
+
             # Retrieve content from target URL
-            crawl_result = await crawler.arun(url=url)
-            # Introduce delay for responsible crawling
-            await asyncio.sleep(0.5)  # Rate limiting
+            async with host_limiter:
+                crawl_result = await crawler.arun(url=url)
 
             # Handle unsuccessful outcomes
             if not crawl_result or not crawl_result.success:
@@ -160,8 +258,8 @@ class Crawl4AICrawler:
             else:
                 page_title = ""
 
-            # Create unique identifier
-            document_id = utils.generate_random_hex(length=32)
+            # Create unique identifier in a single C call
+            document_id = secrets.token_hex(16)
 
             # Construct document from crawled data
             return Document(
@@ -1,7 +1,20 @@
-from .fetch_notion_data import fetch_notion_data
-from .etl import etl
+# Pipeline submodules pull in the full ZenML stack, which costs seconds on a
+# cold interpreter. Defer each import until the pipeline is first accessed
+# (PEP 562) so lightweight consumers of the package don't pay for it.
 
 __all__ = [
     "fetch_notion_data",
     "etl"
 ]
+
+
+def __getattr__(name):
+    if name == "fetch_notion_data":
+        from .fetch_notion_data import fetch_notion_data
+
+        return fetch_notion_data
+    if name == "etl":
+        from .etl import etl
+
+        return etl
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
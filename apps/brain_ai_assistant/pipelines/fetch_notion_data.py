@@ -2,39 +2,43 @@ from pathlib import Path
 from loguru import logger
 from zenml import pipeline
 
-from apps.brain_ai_assistant.steps.fetch_notion_data import (
-    fetch_notion_documents,
-    fetch_notion_documents_metadata,
-)
+from apps.brain_ai_assistant.steps.fetch_notion_data import fetch_notion_database
 from apps.brain_ai_assistant.steps.infrastructure import save_documents_to_disk
 
 
 @pipeline
 def fetch_notion_data(
-    database_ids: list[str], 
-    storage_path: Path
+    database_ids: list[str],
+    storage_path: Path,
+    refresh_notion_cache: bool = False
 ) -> None:
     """
     Pipeline to fetch data from Notion databases and save it to disk.
-    
+
+    Each database's fetch-and-save chain is emitted as an independent branch
+    of the DAG with no edges between branches, so the orchestrator is free to
+    schedule the databases in parallel and the run takes the slowest
+    database's latency instead of the sum of all of them.
+
     Args:
         database_ids: List of Notion database IDs to fetch data from.
         storage_path: Path to store the fetched data.
+        refresh_notion_cache: When True, bypass cached Notion responses and
+            refetch every database from the API.
     """
     notion_storage_path = storage_path / "notion"
     notion_storage_path.mkdir(parents=True, exist_ok=True)
 
-    invocation_ids = []
-    
     for index, database_id in enumerate(database_ids):
         logger.info(f"Processing notion database '{database_id}' and retrieving pages")
-        notion_documents_metadata = fetch_notion_documents_metadata(database_id=database_id)
-        notion_documents_data = fetch_notion_documents(documents_metadata=notion_documents_metadata)
+        notion_documents_data = fetch_notion_database(
+            database_id=database_id,
+            refresh_notion_cache=refresh_notion_cache,
+            id=f"fetch_notion_database_{index}",
+        )
 
-        result = save_documents_to_disk(
+        save_documents_to_disk(
             documents = notion_documents_data,
             output_storage_path = notion_storage_path / f"database_{index}",
+            id=f"save_documents_to_disk_{index}",
         )
-        invocation_ids.append(result.invocation_id)
-
-   
\ No newline at end of file
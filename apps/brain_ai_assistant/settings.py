@@ -1,3 +1,6 @@
+import os
+
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 from loguru import logger
@@ -30,8 +33,37 @@ class Settings(BaseSettings):
     )
 
 
-try:
-    settings = Settings()
-except Exception as e:
-    logger.error(f"Error loading settings: {e}")
-    raise SystemExit(e)
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Build the application settings, loading them at most once per process.
+
+    The first load in the process tree parses .env and snapshots the merged
+    values into os.environ, so ZenML step subprocesses inherit them and skip
+    re-parsing the file on their own first import.
+
+    Returns:
+        Settings: The validated application settings.
+    """
+    try:
+        if os.environ.get("BRAIN_SETTINGS_LOADED"):
+            loaded_settings = Settings(_env_file=None)
+        else:
+            loaded_settings = Settings()
+            for key, value in loaded_settings.model_dump().items():
+                if value is not None and key not in os.environ:
+                    os.environ[key] = str(value)
+            os.environ["BRAIN_SETTINGS_LOADED"] = "1"
+    except Exception as e:
+        logger.error(f"Error loading settings: {e}")
+        raise SystemExit(e)
+
+    return loaded_settings
+
+
+def __getattr__(name):
+    # Keep `from apps.brain_ai_assistant.settings import settings` working
+    # without instantiating Settings at import time
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -21,10 +21,15 @@ def crawl(
     crawler = Crawl4AICrawler(max_concurrent_tasks=concurrent_tasks )
     child_pages = crawler(source_documents)
 
-    # Combine original documents with newly discovered content
-    comprehensive_collection = source_documents.copy()
-    comprehensive_collection.extend(child_pages)
-    comprehensive_collection = list(set(comprehensive_collection))
+    # Combine original documents with newly discovered content, deduplicating
+    # on the stable document id; the first occurrence wins so source
+    # documents take precedence over re-crawled copies
+    seen_documents: dict[str, Document] = {}
+    for document in source_documents:
+        seen_documents.setdefault(document.id, document)
+    for document in child_pages:
+        seen_documents.setdefault(document.id, document)
+    comprehensive_collection = list(seen_documents.values())
 
     logger.info(f"Initial Document count : {len(source_documents)}")
     logger.info(f"Final Document count : {len(comprehensive_collection)}")
@@ -1,4 +1,3 @@
-from .fetch_notion_documents import fetch_notion_documents
-from .fetch_notion_documents_metadata import fetch_notion_documents_metadata
+from .fetch_notion_database import fetch_notion_database
 
-__all__ = ["fetch_notion_documents", "fetch_notion_documents_metadata"]
+__all__ = ["fetch_notion_database"]
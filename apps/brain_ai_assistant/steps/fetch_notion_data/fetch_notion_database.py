@@ -0,0 +1,62 @@
+from typing_extensions import Annotated
+from loguru import logger
+from zenml import get_step_context, step
+
+from apps.brain_ai_assistant.domain import Document
+from apps.brain_ai_assistant.infrastructure.notion import (
+    NotionDatabaseClient,
+    NotionDocumentClient,
+)
+
+
+@step
+def fetch_notion_database(
+    database_id: str,
+    refresh_notion_cache: bool = False,
+    max_workers: int = 8,
+) -> Annotated[list[Document], "notion_documents"]:
+    """
+    Fetch a Notion database's page metadata and content in one step.
+
+    Fusing the metadata query and the content fetch avoids materializing the
+    intermediate list of DocumentMetadata as a ZenML artifact between steps;
+    the metadata feeds the content fetch directly in memory and only the
+    final documents are persisted.
+
+    Args:
+        database_id: The ID of the Notion database to fetch.
+        refresh_notion_cache: When True, bypass the database client's on-disk
+            response cache and refetch from the Notion API.
+        max_workers: Upper bound on documents fetched concurrently. Keep it
+            modest to stay under Notion's per-integration rate limit.
+
+    Returns:
+        list[Document]: List of documents with their fetched content.
+    """
+
+    database_client = NotionDatabaseClient()
+    documents_metadata = database_client.query_notion_database(
+        database_id, refresh=refresh_notion_cache
+    )
+
+    logger.info(f"Fetched {len(documents_metadata)} documents metadata from database {database_id}")
+
+    # The document client walks every document on one event loop, overlapping
+    # block fetches across documents instead of running one loop per thread
+    document_client = NotionDocumentClient()
+    document_collection = document_client.fetch_documents(
+        documents_metadata, max_concurrent_documents=max_workers
+    )
+
+    # Store processing metrics in step context for observability
+    step_context = get_step_context()
+    step_context.add_output_metadata(
+        output_name="notion_documents",
+        metadata={
+            "database_id": database_id,
+            "documents_metadata_count": len(documents_metadata),
+            "document_count": len(document_collection),
+        },
+    )
+
+    return document_collection
@@ -1,5 +1,7 @@
 from zenml.steps import step, get_step_context
 from pydantic import BaseModel
+from pymongo import IndexModel
+from pymongo.write_concern import WriteConcern
 from typing_extensions import Annotated
 from loguru import logger
 
@@ -36,16 +38,50 @@ def store_to_mongodb(
     # Use context manager for automatic resource cleanup
     with MongoDBService(model = model_class_type, collection_name = target_collection) as mongodb_service:
         # Optionally clear  existing collection data before insertion
+        dropped_indexes : list[IndexModel] = []
         if clear_existing_data:
             logger.warning(f"Clear existing data is set to True. Removing all existing data from {target_collection}")
 
             mongodb_service.clear_collection()
-        
-        # Perform bulk insertion of documents
-        mongodb_service.store_documents(document_models)
 
-        # Verify final document count for reporting
-        final_documet_count = mongodb_service.get_collection_count()
+            # Drop secondary indexes for the reload; maintaining them per
+            # inserted document costs far more than one rebuild scan after
+            # the bulk load
+            for index_name, index_info in mongodb_service.collection.index_information().items():
+                if index_name == "_id_":
+                    continue
+                # Carry every index option (unique, sparse, TTL, partial
+                # filter ...) through the rebuild; only the key spec and the
+                # server's bookkeeping fields aren't options
+                index_options = {
+                    option : value
+                    for option, value in index_info.items()
+                    if option not in ("key", "v", "ns")
+                }
+                dropped_indexes.append(
+                    IndexModel(index_info["key"], name = index_name, **index_options)
+                )
+                mongodb_service.collection.drop_index(index_name)
+
+
+        # Snapshot the pre-insert count for reporting; the estimated count
+        # reads collection metadata in O(1) instead of scanning
+        previous_count = 0 if clear_existing_data else mongodb_service.get_collection_count()
+
+        # Perform bulk insertion of documents. The ETL reloads the whole
+        # collection, so per-insert journaling buys nothing; acknowledge on
+        # the primary only and let batches land unordered
+        inserted_count = mongodb_service.store_documents(
+            document_models, write_concern = WriteConcern(w = 1, j = False)
+        )
+
+        # Rebuild the dropped indexes in one pass over the loaded collection
+        if dropped_indexes:
+            mongodb_service.collection.create_indexes(dropped_indexes)
+
+        # The insert results already say how many documents landed, so the
+        # final count needs no follow-up round-trip to the server
+        final_documet_count = previous_count + inserted_count
 
         logger.info(f"Datbase operation completed : {final_documet_count} documents now in collection '{target_collection}'")
 
@@ -2,10 +2,6 @@ import click
 from datetime import datetime as dt
 from pathlib import Path
 
-from apps.brain_ai_assistant.pipelines import (
-    fetch_notion_data,
-    etl
-)
 
 @click.command()
 @click.option(
@@ -26,10 +22,17 @@ from apps.brain_ai_assistant.pipelines import (
     default=False,
     help="Whether to run the ETL pipeline.",
 )
+@click.option(
+    "--refresh-notion",
+    is_flag=True,
+    default=False,
+    help="Bypass cached Notion responses and refetch from the API.",
+)
 def main(
     no_cache: bool = False,
     run_fetch_notion_data_pipeline: bool = False,
-    run_etl_pipeline: bool = False
+    run_etl_pipeline: bool = False,
+    refresh_notion: bool = False
 ) -> None:
     """
     Run the ZenML Second Brain project pipelines.
@@ -40,13 +43,19 @@ def main(
     root_dir = Path(__file__).resolve().parent.parent
     
     if run_fetch_notion_data_pipeline:
-        run_args = {}
+        # Import lazily so `--help` and misconfigured invocations don't pay
+        # the ZenML import cost
+        from apps.brain_ai_assistant.pipelines import fetch_notion_data
+
+        run_args = {"refresh_notion_cache": refresh_notion}
         pipeline_args["config_path"] = root_dir / "configs" / "collect_notion_data.yaml"
         assert pipeline_args["config_path"].exists(), f"Config file not found: {pipeline_args['config_path']}"
         pipeline_args["run_name"] = f"fetch_notion_data_run_{dt.now().strftime('%Y_%m_%d_%H_%M_%S')}"
         fetch_notion_data.with_options(**pipeline_args)(**run_args)
 
     if run_etl_pipeline:
+        from apps.brain_ai_assistant.pipelines import etl
+
         run_args = {}
         pipeline_args["config_path"] = root_dir / "configs" / "etl.yaml"
         assert pipeline_args["config_path"].exists(), (
@@ -1,24 +1,179 @@
-import random
-import string
+import asyncio
+import os
+import secrets
+import threading
+import time
+from functools import lru_cache
+
+_memory_process = None
+
+
+def memory_usage_bytes() -> int | None:
+    """Return the current process RSS in bytes when memory profiling is on.
+
+    Each probe reads /proc/self/stat, so profiling is opt-in via the
+    BRAIN_PROFILE_MEM environment variable to keep hot paths syscall-free
+    in normal runs.
+
+    Returns:
+        int | None: Resident set size in bytes, or None when profiling
+            is disabled.
+    """
+    global _memory_process
+
+    if not os.environ.get("BRAIN_PROFILE_MEM"):
+        return None
+
+    if _memory_process is None:
+        # Imported lazily so non-profiling runs skip the psutil import
+        import psutil
+
+        _memory_process = psutil.Process()
+
+    return _memory_process.memory_info().rss
+
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter for asyncio tasks.
+
+    Tokens refill continuously at `max_rate` per `time_period` seconds. Tasks
+    acquire one token per operation and only block when the budget is actually
+    exhausted, unlike fixed per-call sleeps which stall every worker.
+
+    The bucket deliberately holds no event-loop-bound state: the token
+    arithmetic runs under a plain threading.Lock and the sleep happens
+    outside it, so one bucket instance can pace work across successive
+    asyncio.run calls (a fresh loop per batch) without binding to the first
+    loop it blocked on.
+
+    Attributes:
+        max_rate: Number of operations allowed per time period.
+        time_period: Length of the rate window in seconds.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0) -> None:
+        """Initialize the token bucket.
+
+        Args:
+            max_rate: Maximum operations allowed per time period.
+            time_period: Rate window length in seconds. Defaults to 60.
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = max_rate
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        while True:
+            # Refill and take a token inside a short sync critical section;
+            # the lock is never held across an await
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated_at
+                self._tokens = min(
+                    self.max_rate,
+                    self._tokens + elapsed * (self.max_rate / self.time_period),
+                )
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                # Sleep just long enough for the next token to accrue.
+                # Concurrent waiters may wake together, but the re-check
+                # under the lock keeps the budget exact
+                wait_seconds = (1 - self._tokens) * self.time_period / self.max_rate
+
+            await asyncio.sleep(wait_seconds)
+
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, exception_traceback) -> None:
+        return None
+
 
 def merge_dicts(dict1: dict, dict2: dict) -> dict:
-    """Recursively merge two dictionaries with list handling."""
-    result = dict1.copy()
-
-    for key, value in dict2.items():
-        if key in result:
-            if isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = merge_dicts(result[key], value)
-            elif isinstance(result[key], list) and isinstance(value, list):
-                result[key] = result[key] + value
+    """Merge two dictionaries, combining nested dicts and concatenating lists.
+
+    The merge walks an explicit stack instead of recursing, so each dict is
+    traversed exactly once and ancestor levels are never re-copied the way
+    the recursive copy-per-level version did.
+
+    Args:
+        dict1: Base dictionary; its values lose conflicts.
+        dict2: Overlay dictionary; its values win conflicts.
+
+    Returns:
+        dict: A new dictionary with dict2 merged over dict1.
+    """
+    result: dict = {}
+    stack: list[tuple[dict, dict, dict]] = [(result, dict1, dict2)]
+
+    while stack:
+        merged, base, overlay = stack.pop()
+        merged.update(base)
+
+        for key, value in overlay.items():
+            existing = merged.get(key)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                # Fresh dicts are created only along conflict paths; the
+                # merge of each pair is deferred onto the stack
+                nested: dict = {}
+                stack.append((nested, existing, value))
+                merged[key] = nested
+            elif isinstance(existing, list) and isinstance(value, list):
+                merged[key] = existing + value
             else:
-                result[key] = value
-        else:
-            result[key] = value
+                merged[key] = value
 
     return result
 
 
+@lru_cache(maxsize=8)
+def _get_tokenizer(model_id: str):
+    """Load and cache the tokenizer for a model.
+
+    Args:
+        model_id: Identifier of the language model.
+
+    Returns:
+        The tiktoken encoding for the model, falling back to cl100k_base
+        for models tiktoken doesn't know about.
+    """
+    # Imported lazily so modules that only need the lightweight helpers
+    # don't pay the tokenizer import cost
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model_id)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def clip_tokens(text: str, max_tokens: int, model_id: str) -> str:
+    """Clip text so it fits within a model's token budget.
+
+    Args:
+        text: The text to clip.
+        max_tokens: Maximum number of tokens to keep.
+        model_id: Identifier of the model whose tokenizer to use.
+
+    Returns:
+        str: The text truncated to at most max_tokens tokens.
+    """
+    tokenizer = _get_tokenizer(model_id)
+    tokens = tokenizer.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+
+    return tokenizer.decode(tokens[:max_tokens])
+
+
 def generate_random_hex(length: int) -> str:
     """Generate a random hex string of specified length.
 
@@ -29,5 +184,7 @@ def generate_random_hex(length: int) -> str:
         str: Random hex string of the specified length.
     """
 
-    hex_chars = string.hexdigits.lower()
-    return "".join(random.choice(hex_chars) for _ in range(length))
+    # token_hex emits the whole string in one C call via os.urandom instead
+    # of one Python-level random.choice per character; it always produces an
+    # even length, so round up and trim
+    return secrets.token_hex((length + 1) // 2)[:length]